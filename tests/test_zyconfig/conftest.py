@@ -0,0 +1,21 @@
+""" Shared fixtures for zyconfig tests """
+import sys
+sys.path.append('../../zyconfig/')
+import pytest
+from zyconfig import ZyConfig
+
+CONF_DICT = {
+    'db': {'main': {'host': '10.0.0.1', 'port': '5432', 'pool': '8',
+                    'url': '${db.main.host}:${db.main.port}'},
+           'replica': {'hosts': "['10.0.0.2', '10.0.0.3']", 'padded': "'  x '", 'quoted': "'12'"}},
+    'app': {'main': {'name': 'app', 'ratio': '0.5', 'dsn': 'pg://${db.main.url}', 'port': '${db.main.port}'},
+            'worker': {'dsn': '${app.main.dsn}', 'name': 'worker'}},
+    'server': {'api': {'host': '0.0.0.0', 'port': '8000'},
+               'nosql': {'host': '10.0.0.2', 'port': '9000', 'url': '${server.nosql.host}:9000'}},
+    'log4z_subsys': {'main': {'enable': 'False'}, 'debug': {'enable': 'True'}},
+}
+
+
+@pytest.fixture
+def conf():
+    return ZyConfig.from_dict(CONF_DICT, 'ROOT', 0)
@@ -0,0 +1,99 @@
+""" Test validate config files """
+import sys
+sys.path.append('../../zyconfig/')
+import json
+import pytest
+import check
+from check import check_file, check_paths, main
+
+CONF_FILES = {
+    'valid.ini': '[server@api]\nhost=0.0.0.0\nurl=${server.api.host}:8000\n',
+    'level.ini': '[a@b@c]\nx=1\n',
+    'duplicate.ini': '[a@b]\nx=1\n[a@@b]\ny=2\n',
+    'missing.ini': '[a@b]\nx=${a.b.y}\n',
+    'no_header.ini': 'x=1\n',
+    'no_section.ini': '[@]\nx=1\n',
+}
+
+
+@pytest.fixture
+def conf_dir(tmp_path):
+    for name, content in CONF_FILES.items():
+        (tmp_path / name).write_text(content)
+    (tmp_path / 'notes.txt').write_text('not a config')
+    return tmp_path
+
+
+@pytest.mark.parametrize('name, error', [
+    ('valid.ini', None),
+    ('level.ini', 'MaxConfigLevelError'),
+    ('duplicate.ini', 'DuplicateSubsectionError'),
+    ('missing.ini', 'InterpolationMissingError'),
+    ('no_header.ini', 'MissingSectionHeaderError'),
+    ('no_section.ini', 'InvalidSectionError'),
+])
+def test_check_file(conf_dir, name, error):
+    result = check_file(str(conf_dir / name))
+    assert result['error'] == error
+    assert result['status'] == ('ok' if error is None else 'error')
+    assert result['seconds'] >= 0
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_check_paths(conf_dir, jobs):
+    report = check_paths([str(conf_dir)], jobs=jobs)
+    assert report['summary']['total'] == len(CONF_FILES)
+    assert report['summary']['ok'] == 1
+    assert report['summary']['errors'] == len(CONF_FILES) - 1
+    assert all(not r['cached'] for r in report['files'])
+
+
+def test_check_paths_unexpected_error(conf_dir, monkeypatch):
+    def read(path):
+        raise IndexError(path)
+    monkeypatch.setattr(check.ZyConfig, 'read', staticmethod(read))
+
+    report = check_paths([str(conf_dir)], jobs=1)
+    assert report['summary']['errors'] == len(CONF_FILES)
+    assert {r['error'] for r in report['files']} == {'IndexError'}
+
+
+def test_check_paths_cache(conf_dir, tmp_path):
+    cache_path = str(tmp_path / 'cache.json')
+    check_paths([str(conf_dir)], jobs=1, cache_path=cache_path)
+    (conf_dir / 'missing.ini').write_text('[a@b]\nx=1\n')
+
+    report = check_paths([str(conf_dir)], jobs=1, cache_path=cache_path)
+    results = {r['path']: r for r in report['files']}
+    assert report['summary']['cached'] == len(CONF_FILES) - 1
+    assert results[str(conf_dir / 'missing.ini')]['cached'] is False
+    assert results[str(conf_dir / 'missing.ini')]['status'] == 'ok'
+    assert results[str(conf_dir / 'level.ini')]['error'] == 'MaxConfigLevelError'
+
+
+def test_check_paths_cache_pruned(conf_dir, tmp_path):
+    cache_path = tmp_path / 'cache.json'
+    check_paths([str(conf_dir)], jobs=1, cache_path=str(cache_path))
+    (conf_dir / 'missing.ini').unlink()
+
+    check_paths([str(conf_dir)], jobs=1, cache_path=str(cache_path))
+    cache = json.loads(cache_path.read_text())
+    assert len(cache['results']) == len(CONF_FILES) - 1
+
+
+def test_check_paths_cache_version(conf_dir, tmp_path, monkeypatch):
+    cache_path = str(tmp_path / 'cache.json')
+    check_paths([str(conf_dir)], jobs=1, cache_path=cache_path)
+    monkeypatch.setattr(check, 'CHECK_VERSION', check.CHECK_VERSION + 1)
+
+    report = check_paths([str(conf_dir)], jobs=1, cache_path=cache_path)
+    assert report['summary']['cached'] == 0
+    report = check_paths([str(conf_dir)], jobs=1, cache_path=cache_path)
+    assert report['summary']['cached'] == len(CONF_FILES)
+
+
+def test_main(conf_dir, capsys):
+    assert main(['check', str(conf_dir / 'valid.ini'), '--no-cache', '-j', '1']) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report['summary']['total'] == 1
+    assert main(['check', str(conf_dir), '--no-cache', '-j', '1']) == 1
@@ -0,0 +1,54 @@
+""" Test deduplicate keys and values when config was load """
+import sys
+sys.path.append('../../zyconfig/')
+import pytest
+from zyconfig import ZyConfig
+
+TENANT_CONF = ('[tenant{}@main]\n'
+               'host=db.internal.example.com\n'
+               'path=/var/lib/data/shared\n'
+               'port=54321\n'
+               'ratio=-0.0\n')
+
+
+@pytest.fixture
+def conf_files(tmp_path):
+    paths = []
+    for i in range(2):
+        path = tmp_path / f'tenant{i}.conf.ini'
+        path.write_text(''.join(TENANT_CONF.format(f'{i}_{j}') for j in range(10)))
+        paths.append(str(path))
+    return paths
+
+
+def test_dedup_values_across_files(conf_files):
+    conf = ZyConfig.read(conf_files)
+    assert conf.tenant0_1.main.host is conf.tenant1_9.main.host
+    assert conf.tenant0_1.main.path is conf.tenant1_9.main.path
+    assert conf.tenant0_1.main.get_raw('port') is conf.tenant1_9.main.get_raw('port')
+
+    stats = conf.dedup_stats
+    assert stats['deduplicated'] > 0
+    assert stats['bytes_saved'] > 0
+
+
+def test_dedup_stats_with_overrides(conf_files):
+    conf = ZyConfig.read(conf_files, overrides=['tenant0_1.main.port=1'])
+    assert conf.tenant0_1.main.port == 1
+    assert conf.dedup_stats['deduplicated'] > 0
+    assert conf.dedup_stats['bytes_saved'] > 0
+    assert conf.with_overrides(['tenant0_2.main.port=2']).dedup_stats == conf.dedup_stats
+
+
+def test_dedup_keeps_values(conf_files):
+    conf = ZyConfig.read(conf_files)
+    assert [path for path, _ in conf.select('tenant1_2@main.*')] == \
+        ['tenant1_2.main.host', 'tenant1_2.main.path', 'tenant1_2.main.port', 'tenant1_2.main.ratio']
+    assert conf.tenant1_2.main.port == 54321
+    assert str(conf.tenant1_2.main.ratio) == '-0.0'
+
+
+def test_dedup_float_sign():
+    conf = ZyConfig.from_dict({'a': {'main': {'x': '0.0', 'y': '-0.0'}}}, 'ROOT', 0)
+    assert str(conf.a.main.x) == '0.0'
+    assert str(conf.a.main.y) == '-0.0'
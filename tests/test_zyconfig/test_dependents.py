@@ -0,0 +1,35 @@
+""" Test reverse-dependency index of interpolated values """
+import sys
+sys.path.append('../../zyconfig/')
+import pytest
+
+
+@pytest.mark.parametrize('key, expected', [
+    ('db.main.host', {'db.main.url', 'app.main.dsn', 'app.worker.dsn'}),
+    ('db.main.url', {'app.main.dsn', 'app.worker.dsn'}),
+    ('DB.Main.Port', {'db.main.url', 'app.main.port', 'app.main.dsn', 'app.worker.dsn'}),
+    ('app.worker.dsn', set()),
+    ('app.worker.name', set()),
+])
+def test_dependents(conf, key, expected):
+    assert conf.dependents(key) == expected
+
+
+def test_invalidate_dependents_only(conf):
+    assert conf.db.main.url == '10.0.0.1:5432'
+    assert conf.app.main.port == 5432
+
+    invalidated = conf.db.main.invalidate('db.main.host')
+    assert invalidated == {'db.main.host', 'db.main.url', 'app.main.dsn', 'app.worker.dsn'}
+    assert ('db', 'main', 'url') not in conf.resolved_cache
+    assert conf.resolved_cache[('app', 'main', 'port')] == 5432
+
+    assert conf.db.main.url == '10.0.0.1:5432'
+
+
+@pytest.mark.parametrize('key', ['db.host', 'no.such.key', 'db.main.hots', 'db.main', 'db.main.host.x'])
+def test_dependents_invalid_key(conf, key):
+    with pytest.raises(KeyError):
+        conf.dependents(key)
+    with pytest.raises(KeyError):
+        conf.invalidate(key)
@@ -0,0 +1,69 @@
+""" Test write config to INI and JSON """
+import sys
+sys.path.append('../../zyconfig/')
+import io
+import json
+import pytest
+from zyconfig import ZyConfig
+
+CONF_FILE = '../../conf/env/development/dev.conf.ini'
+
+
+@pytest.mark.parametrize('resolve', [True, False])
+def test_dump_ini_round_trip(conf, tmp_path, resolve):
+    path = tmp_path / 'snapshot.conf.ini'
+    with open(path, 'w') as fp:
+        conf.db.dump_ini(fp, resolve=resolve)
+
+    snapshot = ZyConfig.read(str(path))
+    for key, value in conf.select('db.*.*'):
+        section, subsection, option = key.split('.')
+        assert snapshot[section][subsection][option] == value
+
+
+def test_dump_ini_headers(conf):
+    buffer = io.StringIO()
+    conf.dump_ini(buffer, resolve=False)
+    text = buffer.getvalue()
+    assert '[db]\n' in text
+    assert '[db@replica]\n' in text
+    assert 'url = ${db.main.host}:${db.main.port}\n' in text
+
+
+def test_dump_ini_file_round_trip(tmp_path):
+    conf = ZyConfig.read(CONF_FILE)
+    path = tmp_path / 'dev.conf.ini'
+    with open(path, 'w') as fp:
+        conf.dump_ini(fp)
+    assert ZyConfig.read(str(path)).pretty() == conf.pretty()
+
+
+@pytest.mark.parametrize('resolve, expected_url', [
+    (True, '10.0.0.1:5432'),
+    (False, '${db.main.host}:${db.main.port}'),
+])
+def test_dump_json(conf, resolve, expected_url):
+    buffer = io.StringIO()
+    conf.db.dump_json(buffer, resolve=resolve)
+    data = json.loads(buffer.getvalue())
+    assert data['main']['url'] == expected_url
+    assert data['main']['pool'] == 8
+    assert data['replica']['hosts'] == ['10.0.0.2', '10.0.0.3']
+
+
+def test_dump_ini_invalid_level():
+    conf = ZyConfig.from_dict({'hello': 'world'}, 'ROOT', 0)
+    with pytest.raises(ValueError):
+        conf.dump_ini(io.StringIO())
+
+
+def test_pretty(conf):
+    text = conf.pretty()
+    assert text.startswith('db:\n  main:\n    host = 10.0.0.1\n')
+    assert '    url = ${db.main.host}:${db.main.port}\n' in text
+    assert conf.db.main.pretty().startswith('host = 10.0.0.1\n')
+
+
+def test_pretty_any_level():
+    assert ZyConfig.from_dict({'hello': 'world'}, 'ROOT', 0).pretty() == 'hello = world\n'
+    assert ZyConfig.from_dict({}, 'ROOT', 0).pretty() == ''
@@ -30,3 +30,32 @@ class TestGetConfig:
         value = getattr(conf, option)
         print('key={}, value={}'.format('.'.join([section, subsection, option]), value))
         assert isinstance(value, expected_type)
+
+
+@pytest.mark.parametrize('content, key, expected', [
+    ('[math@setting]\narg1 = 1.0\n', 'math@setting.arg1', 1.0),
+    ('[log4z_subsys]\nenable = False\n', 'log4z_subsys.main.enable', False),
+    ('[a]\nx=1\n[b@c]\ny=${a.main.x}\n', 'b.c.y', 1),
+])
+def test_read_value(tmp_path, content, key, expected):
+    path = tmp_path / 'read_value.conf.ini'
+    path.write_text(content)
+    assert ZyConfig.read_value(str(path), key) == expected
+
+
+@pytest.mark.parametrize('content, key', [
+    ('[a@b@c]\nx=1\n[d]\ny=2\n', 'd.main.y'),
+    ('[Srv@API]\nx=1\n[srv@api]\nx=2\n', 'srv.api.x'),
+    ('[a@main]\nx=1\n[a]\ny=1\n', 'a.main.x'),
+    ('[a]\nx=1\n', 'b.main.x'),
+    ('[a]\nx=1\n', 'a.b.x'),
+    ('[a]\nx=1\n', 'a.main.y'),
+])
+def test_read_value_same_error_as_read(tmp_path, content, key):
+    path = tmp_path / 'read_value.conf.ini'
+    path.write_text(content)
+    section, subsection, option = key.split('.')
+    with pytest.raises(Exception) as expected:
+        ZyConfig.read(str(path))[section][subsection][option]
+    with pytest.raises(expected.type):
+        ZyConfig.read_value(str(path), key)
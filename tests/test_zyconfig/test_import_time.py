@@ -0,0 +1,69 @@
+""" Test import time of zyconfig """
+import os
+import sys
+import json
+import subprocess
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# cold `import zyconfig` (with its dependencies configparser, re, enum) in a fresh
+# interpreter with compiled bytecode measured 15-19 ms, budget is ~60% above best run
+IMPORT_TIME_BUDGET = 0.025
+LAZY_MODULES = ['ast', 'json', 'typing', 'argparse', 'concurrent.futures']
+
+MODULES_SCRIPT = '''
+import sys
+before = set(sys.modules)
+import zyconfig
+modules = sorted(set(sys.modules) - before)
+import json
+print(json.dumps(modules))
+'''
+
+READ_SCRIPT = '''
+import sys
+before = set(sys.modules)
+import zyconfig
+value = zyconfig.ZyConfig.read_value(sys.argv[1], 'log4z_subsys@main.enable')
+modules = sorted(set(sys.modules) - before)
+import json
+print(json.dumps({'value': value, 'modules': modules}))
+'''
+
+
+def run_script(script, *args):
+    output = subprocess.check_output([sys.executable, '-c', script] + list(args), cwd=ROOT_DIR)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def import_time(env):
+    """ cumulative time of `import zyconfig` reported by -X importtime, in seconds """
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import zyconfig'],
+                            cwd=ROOT_DIR, env=env, stderr=subprocess.PIPE, check=True).stderr
+    for line in output.decode().splitlines():
+        _, cumulative, name = line.split('|')
+        if name.strip() == 'zyconfig':
+            return int(cumulative) / 1e6
+    raise AssertionError('zyconfig is not imported')
+
+
+def test_import_time_budget(tmp_path):
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(tmp_path))
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    # first run compiles bytecode
+    import_time(env)
+    # best of some runs, avoid noise from a busy machine
+    seconds = min(import_time(env) for _ in range(5))
+    assert seconds < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize('module', LAZY_MODULES)
+def test_import_is_lazy(module):
+    assert module not in run_script(MODULES_SCRIPT)
+
+
+def test_read_value_is_lazy():
+    result = run_script(READ_SCRIPT, os.path.join('conf', 'env', 'development', 'dev.conf.ini'))
+    assert result['value'] is False
+    assert 'ast' not in result['modules']
@@ -0,0 +1,104 @@
+""" Test apply overrides to config """
+import sys
+sys.path.append('../../zyconfig/')
+import pytest
+from zyconfig import ZyConfig, OverrideError, ReadOnlyConfigError
+
+CONF_FILE = '../../conf/env/development/dev.conf.ini'
+
+
+@pytest.mark.parametrize('overrides, section, subsection, option, expected', [
+    (['db.main.pool=64'], 'db', 'main', 'pool', 64),
+    (['db@main.pool = 64'], 'db', 'main', 'pool', 64),
+    (['db.main.host=10.0.0.9'], 'db', 'main', 'url', '10.0.0.9:5432'),
+    (['app.main.ratio=1'], 'app', 'main', 'ratio', 1),
+    (['app.main.name=[1, 2]'], 'app', 'main', 'name', [1, 2]),
+    (['cache.main.size=128'], 'cache', 'main', 'size', 128),
+])
+def test_with_overrides(conf, overrides, section, subsection, option, expected):
+    new_conf = conf.with_overrides(overrides)
+    assert new_conf[section][subsection][option] == expected
+
+
+def test_with_overrides_keeps_origin(conf):
+    assert conf.db.main.url == '10.0.0.1:5432'
+    new_conf = conf.with_overrides(['db.main.host=10.0.0.9', 'db.main.pool=16'])
+    assert ('db', 'main', 'url') not in new_conf.resolved_cache
+    assert new_conf.db.main.url == '10.0.0.9:5432'
+    assert conf.db.main.url == '10.0.0.1:5432'
+    assert conf.db.main.pool == 8
+    # options of untouched subsections are shared, nodes belong to the new config
+    assert new_conf.server is not conf.server
+    assert new_conf.server.api._content is conf.server.api._content
+    assert new_conf.server.nosql.url == '10.0.0.2:9000'
+
+
+def test_with_overrides_interpolate_untouched(conf):
+    assert conf.app.main.port == 5432
+    new_conf = conf.with_overrides(['db.main.port=6432'])
+    assert new_conf.app.main.port == 6432
+    assert conf.app.main.port == 5432
+
+
+def test_with_overrides_no_shared_write(conf):
+    new_conf = conf.with_overrides(['db.main.pool=16'])
+    new_conf.server.api.z = '3'
+    conf.server.api.w = '4'
+    assert new_conf.server.api.z == 3
+    assert conf.server.api.w == 4
+    assert 'z' not in conf.server.api.keys()
+    assert 'w' not in new_conf.server.api.keys()
+
+
+def test_with_overrides_no_leak_from_origin(conf):
+    new_conf = conf.with_overrides(['db.main.pool=16'])
+    # origin is modified before shared nodes are accessed in new config
+    conf.app.main.z = '9'
+    conf.db.main.z = '9'
+    assert 'z' not in new_conf.app.main.keys()
+    assert 'z' not in new_conf.db.main.keys()
+    assert list(new_conf.select('*.main.z')) == []
+    assert list(conf.select('*.main.z')) == [('db.main.z', 9), ('app.main.z', 9)]
+    # reading new config doesn't make origin read only
+    assert new_conf.app.main.name == conf.app.main.name
+    conf.app.main.w = '1'
+    assert conf.app.main.w == 1
+    assert 'w' not in new_conf.app.main.keys()
+
+
+@pytest.mark.parametrize('overrides', [
+    ['db.main.pool'],
+    ['db.main=1'],
+    ['db.main.pool=abc'],
+    ['db.main.pool=True'],
+    ['app.main.ratio=fast'],
+    ['db.main.host=1', 'db.main.pool=1.5'],
+    ['db.main.host=$oops'],
+    ['db.main.host=${db.main}'],
+    ['db.main.host=${db..port}'],
+    ['db.main.host=${db.main.port'],
+    ['db.main.host=$${db.main.port}'],
+    ['db.main.host=10.0.0.1', None],
+])
+def test_invalid_overrides(conf, overrides):
+    with pytest.raises(OverrideError):
+        conf.with_overrides(overrides)
+
+
+@pytest.mark.parametrize('override, expected', [
+    ('app.main.name=C:\\data', 'C:\\data'),
+    ('app.main.name=${db.main.host}/app', '10.0.0.1/app'),
+    ('db.main.pool=${db.main.port}', 5432),
+    ('log4z_subsys.main.enable=${log4z_subsys.debug.enable}', True),
+])
+def test_override_values(conf, override, expected):
+    key = override.partition('=')[0]
+    new_conf = conf.with_overrides([override])
+    assert dict(new_conf.select(key)) == {key: expected}
+
+
+def test_read_with_overrides():
+    conf = ZyConfig.read(CONF_FILE, overrides=['math@setting.arg1=5', 'log4z_subsys.main.enable=True'])
+    assert conf.math.setting.arg1 == 5
+    assert conf.math.setting.arg2 == 2.234324
+    assert conf.log4z_subsys.main.enable is True
@@ -0,0 +1,57 @@
+""" Test select values by pattern """
+import sys
+sys.path.append('../../zyconfig/')
+import types
+import pytest
+from zyconfig import DictConfig
+
+
+@pytest.mark.parametrize('pattern, expected', [
+    ('server@*.port', [('server.api.port', 8000), ('server.nosql.port', 9000)]),
+    ('server.*.port', [('server.api.port', 8000), ('server.nosql.port', 9000)]),
+    ('*.*.enable', [('log4z_subsys.main.enable', False), ('log4z_subsys.debug.enable', True)]),
+    ('server@nosql.u*', [('server.nosql.url', '10.0.0.2:9000')]),
+    ('Server@API.Host', [('server.api.host', '0.0.0.0')]),
+    ('*.*.missing', []),
+])
+def test_select_options(conf, pattern, expected):
+    assert list(conf.select(pattern)) == expected
+
+
+@pytest.mark.parametrize('pattern, expected_paths', [
+    ('log4z_subsys.*', ['log4z_subsys.main', 'log4z_subsys.debug']),
+    ('log*', ['log4z_subsys']),
+])
+def test_select_nodes(conf, pattern, expected_paths):
+    selected = list(conf.select(pattern))
+    assert [path for path, _ in selected] == expected_paths
+    assert all(isinstance(node, DictConfig) for _, node in selected)
+
+
+def test_select_is_lazy(conf):
+    selected = conf.server.select('server@*.*')
+    assert isinstance(selected, types.GeneratorType)
+    assert next(selected) == ('server.api.host', '0.0.0.0')
+    assert ('server', 'nosql', 'url') not in conf.resolved_cache
+
+
+@pytest.mark.parametrize('pattern, expected_paths', [
+    ('*.*.port', ['server.api.port', 'server.nosql.port']),
+    ('*.nosql.*', ['server.nosql.host', 'server.nosql.port', 'server.nosql.url']),
+    ('*.*', ['server.api', 'server.nosql']),
+    ('db.*.*', []),
+])
+def test_select_under_node(conf, pattern, expected_paths):
+    assert [path for path, _ in conf.server.select(pattern)] == expected_paths
+
+
+def test_select_under_subsection(conf):
+    assert [path for path, _ in conf.server.api.select('*.*.port')] == ['server.api.port']
+
+
+def test_select_after_set(conf):
+    assert list(conf.select('app.main.extra')) == []
+    conf.app.main.extra = 'x'
+    assert list(conf.select('*.*.extra')) == [('app.main.extra', 'x')]
+    conf.app.main.ref = '${app.main.extra}'
+    assert conf.dependents('app.main.extra') == {'app.main.ref'}
@@ -1,13 +1,14 @@
 # Created by tuns at 26/09/2019
 
 from __future__ import print_function
-from zyconfig import ZyConfig
-from zyconfig import DuplicateOptionError, DuplicateSectionError, DuplicateSubsectionError, \
+from .zyconfig import ZyConfig
+from .zyconfig import DuplicateOptionError, DuplicateSectionError, DuplicateSubsectionError, \
            NoSectionError, NoSubsectionError, NoOptionError, MissingSectionHeaderError, \
            InterpolationDepthError, InterpolationError, DictConfig, InterpolationNodeError,\
-           ReadOnlyConfigError, ZInterpolation
+           ReadOnlyConfigError, ZInterpolation, OverrideError, InvalidSectionError
 
 __all__ = ["ZyConfig", "DuplicateOptionError", "DuplicateSectionError", "DuplicateSubsectionError",
            "NoSectionError", "NoSubsectionError", "NoOptionError", "MissingSectionHeaderError",
            "InterpolationDepthError", "InterpolationError", "InterpolationNodeError", "DictConfig",
-           "ZInterpolation", "ReadOnlyConfigError"]
+           "ZInterpolation", "ReadOnlyConfigError", "OverrideError",
+           "InvalidSectionError"]
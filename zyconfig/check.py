@@ -0,0 +1,171 @@
+"""validate config files
+
+every file is read by ZyConfig.read and all interpolations are resolved,
+files are checked in parallel by a process pool, results are cached by content hash
+so unchanged files are skipped in next run.
+
+usage :
+python -m zyconfig check conf/ other/conf/dir/ [--jobs 8] [--cache .zyconfig-check-cache.json]
+"""
+
+from __future__ import print_function
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from fnmatch import fnmatch
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator, List, Optional
+
+from zyconfig import ZyConfig
+
+__all__ = ["check_file", "check_paths", "find_files", "main"]
+
+DEFAULT_PATTERN = "*.ini"
+DEFAULT_CACHE = ".zyconfig-check-cache.json"
+# bump when result of checking changes without changes of zyconfig sources
+CHECK_VERSION = 1
+
+
+def find_files(paths: List[str], pattern: str = DEFAULT_PATTERN) -> Iterator[str]:
+    """ iterate config files in paths (files or directories) """
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if fnmatch(filename, pattern):
+                        yield os.path.join(dirpath, filename)
+        else:
+            yield path
+
+
+def content_hash(path: str) -> str:
+    with open(path, 'rb') as fp:
+        return hashlib.sha256(fp.read()).hexdigest()
+
+
+def check_file(path: str) -> dict:
+    """ read config file and resolve all values, return result of checking """
+    start = time.perf_counter()
+    result = {'path': path, 'status': 'ok', 'error': None, 'message': None}
+    try:
+        conf = ZyConfig.read(path)
+        for _ in conf.select('*.*.*'):
+            pass
+    except Exception as err:
+        result['status'] = 'error'
+        result['error'] = type(err).__name__
+        result['message'] = str(err)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def cache_version() -> str:
+    """ version of cached results, changes when zyconfig or check is modified """
+    digest = hashlib.sha256()
+    for path in (sys.modules[ZyConfig.__module__].__file__, __file__):
+        digest.update(content_hash(path).encode())
+    return f'{CHECK_VERSION}:{digest.hexdigest()}'
+
+
+def _load_cache(cache_path: Optional[str], version: str) -> dict:
+    """ load {content hash : result}, discard cache of another version """
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path) as fp:
+            cache = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != version:
+        return {}
+    return cache.get('results', {})
+
+
+def _save_cache(cache_path: Optional[str], version: str, results: dict):
+    if not cache_path:
+        return
+    with open(cache_path, 'w') as fp:
+        json.dump({'version': version, 'results': results}, fp)
+
+
+def check_paths(paths: List[str], jobs: Optional[int] = None, cache_path: Optional[str] = None,
+                pattern: str = DEFAULT_PATTERN) -> dict:
+    """ check all config files in paths, return report {'files' : [...], 'summary' : {...}} """
+    start = time.perf_counter()
+    version = cache_version()
+    cache = _load_cache(cache_path, version)
+    results = {}
+    pending = []
+    hashes = {}
+    for path in find_files(paths, pattern):
+        try:
+            digest = content_hash(path)
+        except OSError as err:
+            results[path] = {'path': path, 'status': 'error', 'error': type(err).__name__,
+                             'message': str(err), 'seconds': 0.0, 'cached': False}
+            continue
+        hashes[path] = digest
+        if digest in cache:
+            results[path] = dict(cache[digest], path=path, seconds=0.0, cached=True)
+        else:
+            pending.append(path)
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(pending) > 1:
+        chunksize = max(1, len(pending) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            checked = list(executor.map(check_file, pending, chunksize=chunksize))
+    else:
+        checked = [check_file(path) for path in pending]
+
+    for result in checked:
+        result['cached'] = False
+        result['sha256'] = hashes[result['path']]
+        results[result['path']] = result
+        cache[result['sha256']] = {'status': result['status'], 'error': result['error'],
+                                   'message': result['message']}
+    # keep only results of files which were seen in this run
+    seen = set(hashes.values())
+    _save_cache(cache_path, version, {digest: r for digest, r in cache.items() if digest in seen})
+
+    files = list(results.values())
+    for result in files:
+        result.setdefault('sha256', hashes.get(result['path']))
+    seconds = time.perf_counter() - start
+    summary = {
+        'total': len(files),
+        'ok': sum(1 for r in files if r['status'] == 'ok'),
+        'errors': sum(1 for r in files if r['status'] == 'error'),
+        'cached': sum(1 for r in files if r['cached']),
+        'seconds': seconds,
+        'files_per_second': len(files) / seconds if seconds > 0 else None,
+    }
+    return {'files': files, 'summary': summary}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m zyconfig')
+    commands = parser.add_subparsers(dest='command')
+    check_parser = commands.add_parser('check', help='validate config files and resolve all interpolations')
+    check_parser.add_argument('paths', nargs='+', help='config files or directories')
+    check_parser.add_argument('-j', '--jobs', type=int, default=None,
+                              help='number of worker processes (default: number of cpus)')
+    check_parser.add_argument('--pattern', default=DEFAULT_PATTERN,
+                              help='pattern of config file names in directories (default: %(default)s)')
+    check_parser.add_argument('--cache', default=DEFAULT_CACHE,
+                              help='file to cache results by content hash (default: %(default)s)')
+    check_parser.add_argument('--no-cache', dest='cache', action='store_const', const=None,
+                              help='check all files, do not read or write cache')
+    args = parser.parse_args(argv)
+    if args.command != 'check':
+        parser.print_help()
+        return 2
+
+    report = check_paths(args.paths, jobs=args.jobs, cache_path=args.cache, pattern=args.pattern)
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+    return 1 if report['summary']['errors'] else 0
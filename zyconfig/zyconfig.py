@@ -23,15 +23,21 @@ key_2 = ${subsec_1:key_1}/whatever
 
 """
 
-from __future__ import print_function
+from __future__ import print_function, annotations
 import re
 from configparser import RawConfigParser
 from enum import Enum
 from configparser import Error, DuplicateSectionError, DuplicateOptionError, NoSectionError, MissingSectionHeaderError
 from collections.abc import MutableMapping
-from ast import literal_eval
-from typing import Union, Any, Optional, List, Type
+from types import MappingProxyType
+from fnmatch import fnmatchcase
 import os
+import sys
+
+# typing, ast and json are loaded only when needed, keep import of zyconfig fast
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Union, Any, Optional, List, Type, Iterator, Tuple
 
 __all__ = ["DuplicateOptionError", "DuplicateSectionError", "DuplicateSubsectionError",
            "NoSectionError", "NoSubsectionError", "NoOptionError", "MissingSectionHeaderError",
@@ -43,6 +49,19 @@ __all__ = ["DuplicateOptionError", "DuplicateSectionError", "DuplicateSubsection
 _UNSET = object()
 
 
+class _LazyAttribute:
+    """ class attribute which is created by factory on first access """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.value = _UNSET
+
+    def __get__(self, instance, owner):
+        if self.value is _UNSET:
+            self.value = self.factory()
+        return self.value
+
+
 # define error
 class ReadOnlyConfigError(Error):
     """ Raised input config is modified """
@@ -87,6 +106,14 @@ class InvalidSubsectionError(Error):
         Error.__init__(self, msg)
 
 
+class InvalidSectionError(Error):
+    """ Raised when a header of an input source has no section name """
+
+    def __init__(self, header):
+        msg = ("Invalid section name in header : {!r}".format(header))
+        Error.__init__(self, msg)
+
+
 class DuplicateSubsectionError(Error):
     """ Raised when a subsection is repeated in a same section
     and input source"""
@@ -140,6 +167,48 @@ class InterpolationMissingError(InterpolationError):
     pass
 
 
+class OverrideError(Error):
+    """ Raised when an override can't be parsed or applied to config """
+
+    def __init__(self, override, msg):
+        Error.__init__(self, f'Invalid override {override!r}: {msg}')
+        self.override = override
+        self.args = (override, msg)
+
+
+class ValuePool:
+    """ share identical keys and values between options while config is loaded """
+
+    # immutable types of values which can be shared between options
+    SHARED_TYPES = (str, int, float)
+
+    def __init__(self):
+        self._values = {}
+        self.deduplicated = 0
+        self.bytes_saved = 0
+
+    def key(self, key: str) -> str:
+        interned = sys.intern(key)
+        if interned is not key:
+            self.deduplicated += 1
+            self.bytes_saved += sys.getsizeof(key)
+        return interned
+
+    def value(self, value: Any) -> Any:
+        if type(value) not in self.SHARED_TYPES:
+            return value
+        # float is keyed by repr to keep 0.0 and -0.0 apart
+        pool_key = (type(value), repr(value) if isinstance(value, float) else value)
+        shared = self._values.setdefault(pool_key, value)
+        if shared is not value:
+            self.deduplicated += 1
+            self.bytes_saved += sys.getsizeof(value)
+        return shared
+
+    def stats(self) -> dict:
+        return {'deduplicated': self.deduplicated, 'bytes_saved': self.bytes_saved}
+
+
 class ConfigLevel(Enum):
     SECTION = 0
     SUBSECTION = 1
@@ -153,25 +222,57 @@ class ZInterpolation:
     # max depth of interpolation
     _MAX_INTERPOLATION_DEPTH = 1
     # regex to match form of interpolation
-    _KEYRE = re.compile(r"\$\{([^}]+)\}")
+    _KEYRE = _LazyAttribute(lambda: re.compile(r"\$\{([^}]+)\}"))
+    # names which can start a literal (literal_eval) value
+    _LITERAL_NAMES = {'True': True, 'False': False, 'None': None}
 
     def __init__(self):
         pass
 
-    def before_get(self, dict_config: Any, raw_value: Any) -> Any:
+    def before_get(self, dict_config: Any, option: str, raw_value: Any) -> Any:
         """
-        :param dict_config:
-        :param section:
-        :param subsection:
-        :param option:
-        :return:
+        :param dict_config: node which holds the option
+        :param option: name of option
+        :param raw_value: raw value of option
+        :return: interpolated value, cached in the root node
         """
         root_config = dict_config.get_root()
-        keys = dict_config.get_full_key(raw_value)
+        keys = dict_config.get_full_key(dict_config.normalize_key(option))
         if len(keys) != 3:
             raise InterpolationNodeError(dict_config.cfg_level_type)
+        full_key = tuple(keys)
+        resolved = root_config.resolved_cache
+        if full_key in resolved:
+            return resolved[full_key]
         section, subsection, option = keys
-        return self._do_interpolation(root_config, section, subsection, option, raw_value)
+        value = self._do_interpolation(root_config, section, subsection, option, raw_value)
+        resolved[full_key] = value
+        return value
+
+    def get_references(self, raw_value: Any) -> List[tuple]:
+        """ list of (section, subsection, option) which are referred by raw_value """
+        if not self.evaluate_type(raw_value):
+            return []
+        references = []
+        for path in self._KEYRE.findall(raw_value.replace('$$', '')):
+            opts = path.split('.')
+            if len(opts) == 3:
+                references.append(tuple(opt.lower() for opt in opts))
+        return references
+
+    def build_dependency_index(self, root_config: Any) -> dict:
+        """ build reverse-dependency index {referred key : set of keys which refer to it} """
+        dependents = {}
+        for section, section_config in root_config._content.items():
+            if not isinstance(section_config, DictConfig):
+                continue
+            for subsection, subsect_config in section_config._content.items():
+                if not isinstance(subsect_config, DictConfig):
+                    continue
+                for option, raw_value in subsect_config._content.items():
+                    for ref in self.get_references(raw_value):
+                        dependents.setdefault(ref, set()).add((section, subsection, option))
+        return dependents
 
     def evaluate_type(self, value: Any, value_type: Any = None):
         if value_type is None:
@@ -266,12 +367,46 @@ class ZInterpolation:
         return self.infer_type(raw_value)
 
     def infer_type(self, raw_value: Any) -> Any:
+        # common values (words, paths, booleans, integers) are inferred without ast
+        if isinstance(raw_value, str) and raw_value:
+            if raw_value in self._LITERAL_NAMES:
+                return self._LITERAL_NAMES[raw_value]
+            digits = raw_value[1:] if raw_value[0] == '-' else raw_value
+            if digits.isascii() and digits.isdigit() and (digits == '0' or digits[0] != '0'):
+                try:
+                    return int(raw_value)
+                except ValueError:
+                    pass
+            # no literal starts with path separator or interpolation
+            if raw_value[0] in '/$':
+                return raw_value
+            if raw_value[0].isalpha() or raw_value[0] == '_':
+                end = 1
+                while end < len(raw_value) and (raw_value[end].isalnum() or raw_value[end] == '_'):
+                    end += 1
+                # string prefix (b'', r''), True/False/None expressions and set()
+                if raw_value[end:end + 1] not in ('"', "'", '(') and raw_value[:end] not in self._LITERAL_NAMES:
+                    return raw_value
+
+        from ast import literal_eval
         try:
             val = literal_eval(raw_value)
         except (ValueError, SyntaxError):
             return str(raw_value)
         return val
 
+    def check_syntax(self, raw_value: str):
+        """ raise ValueError if raw_value has a '$' which doesn't start a ${section.subsection.option} reference """
+        for match in self._KEYRE.finditer(raw_value):
+            opts = match.group(1).split('.')
+            if len(opts) != 3 or not all(opt.strip() for opt in opts):
+                raise ValueError(f'invalid interpolation key {match.group(0)!r} at position {match.start()}, '
+                                 'expected ${section.subsection.option}')
+        position = self._KEYRE.sub(lambda match: ' ' * len(match.group(0)), raw_value).find('$')
+        if position >= 0:
+            raise ValueError(f'invalid interpolation syntax at position {position}, '
+                             'expected ${section.subsection.option}')
+
     def before_set(self, dict_config, option, raw_value, auto_infer=True):
         escaped_value = raw_value.replace('$$', '')
         escaped_value = self._KEYRE.sub(escaped_value, '')
@@ -290,25 +425,38 @@ class DictConfig(MutableMapping):
     (ex : sections or subsections) """
 
     # Default interpolation
-    _INTERPOLATION = ZInterpolation()
+    _INTERPOLATION = _LazyAttribute(ZInterpolation)
     # flags
     _READONLY = True
     DO_INTERPOLATION = True
+    # split full key section@subsection.option or section.subsection.option
+    _KEY_SPLITRE = _LazyAttribute(lambda: re.compile(r"[.@]"))
 
-    def __init__(self, contents, config_level_type, parent_node=_UNSET):
+    def __init__(self, contents, config_level_type, parent_node=_UNSET, value_pool=None):
 
         # connect to higher order of config level, ex; subsection -> section
         self.__dict__['_parent'] = parent_node
+        # key of this node in parent node
+        self.__dict__['_name'] = _UNSET
 
         if type(config_level_type) == ConfigLevel:
             self.__dict__['cfg_level_type'] = config_level_type
         else:
             self.__dict__['cfg_level_type'] = ConfigLevel.UNKNOW
 
+        # cache of interpolated values and reverse-dependency index,
+        # only used by root node (lazy init)
+        self.__dict__['_resolved'] = _UNSET
+        self.__dict__['_dependents'] = _UNSET
+        # index of option paths, built at load time (root node only)
+        self.__dict__['_paths'] = _UNSET
+        # stats of deduplicated keys and values (root node only)
+        self.__dict__['_dedup_stats'] = _UNSET
+
         self.__dict__['_content'] = {}
         if contents:
             for k, v in contents.items():
-                self._setitem(k, v)
+                self._setitem(k, v, value_pool)
 
     def __dir__(self):
         return self.__dict__['_content'].keys()
@@ -333,7 +481,7 @@ class DictConfig(MutableMapping):
     def __delitem__(self, key):
         if DictConfig._READONLY:
             raise ReadOnlyConfigError()
-        del self._content[key]
+        del self._own_content()[key]
 
     def __setitem__(self, key, value):
         raise ReadOnlyConfigError()
@@ -346,8 +494,8 @@ class DictConfig(MutableMapping):
         """ get content của config """
         return self._get(key)
 
-    def _setitem(self, key, value):
-        """ a private method to set content """
+    def _setitem(self, key, value, value_pool=None):
+        """ a private method to set content, keys and values are shared by value_pool """
         normalized_key = self.normalize_key(key)
         # if exists
         if normalized_key in self._content:
@@ -360,7 +508,15 @@ class DictConfig(MutableMapping):
             value = self._INTERPOLATION.before_set(self, key, value)
         elif not isinstance(value, DictConfig):
             raise ValueError(value)
-        self.__dict__['_content'][normalized_key] = value
+        if value_pool is not None:
+            normalized_key = value_pool.key(normalized_key)
+            value = value_pool.value(value)
+        self._own_content()[normalized_key] = value
+        # paths and dependents of tree are changed, rebuild them on next use
+        node = self
+        while isinstance(node.parent, DictConfig):
+            node = node.parent
+        node.__dict__.update(_paths=_UNSET, _dependents=_UNSET)
 
     def _convert_to_boolean(self, value):
         if isinstance(value, DictConfig) and \
@@ -381,7 +537,7 @@ class DictConfig(MutableMapping):
             value = self.get_raw(key)
             if self.cfg_level_type == ConfigLevel.OPTION and \
                     self._INTERPOLATION.evaluate_type(value, str):
-                value = self._INTERPOLATION.before_get(self, value)
+                value = self._INTERPOLATION.before_get(self, key, value)
 
         except KeyError:
             if self.cfg_level_type == ConfigLevel.SECTION:
@@ -404,10 +560,10 @@ class DictConfig(MutableMapping):
             raise
 
     def __str__(self):
-        return self._content.__str__()
+        return dict(self._content).__str__()
 
     def __repr__(self):
-        return self._content.__repr__()
+        return dict(self._content).__repr__()
 
     def keys(self):
         return self._content.keys()
@@ -469,12 +625,12 @@ class DictConfig(MutableMapping):
         """ get full key """
         node = self
         keys = [key]
-        while node:
-            assert isinstance(node, DictConfig)
-            if node.parent:
-                assert isinstance(node.parent, DictConfig)
-                for k, v in node.parent.items():
-                    if id(v) == id(node):
+        while isinstance(node.parent, DictConfig):
+            if node._name is not _UNSET:
+                keys.append(node._name)
+            else:
+                for k, v in node.parent._content.items():
+                    if v is node:
                         keys.append(k)
                         break
 
@@ -491,9 +647,295 @@ class DictConfig(MutableMapping):
 
         return node
 
-    def pretty(self) -> str:
-        """ print the representation of DictConfig """
-        pass
+    @property
+    def resolved_cache(self) -> dict:
+        """ cache of interpolated values {(section, subsection, option) : value} of the whole tree """
+        root = self.get_root()
+        if root._resolved is _UNSET:
+            root.__dict__['_resolved'] = {}
+        return root._resolved
+
+    def _get_dependents_index(self) -> dict:
+        root = self.get_root()
+        if root._dependents is _UNSET:
+            root.__dict__['_dependents'] = self._INTERPOLATION.build_dependency_index(root)
+        return root._dependents
+
+    def _split_full_key(self, key: Union[str, tuple, list]) -> tuple:
+        """ 'section.subsection.option' => (section, subsection, option),
+        raise KeyError if option doesn't exist in the tree """
+        keys = key.split('.') if isinstance(key, str) else list(key)
+        if len(keys) != 3:
+            raise KeyError(key)
+        keys = tuple(self.normalize_key(k) for k in keys)
+        node = self.get_root()
+        for k in keys:
+            if not isinstance(node, DictConfig) or k not in node._content:
+                raise KeyError(key)
+            node = node._content[k]
+        if isinstance(node, DictConfig):
+            raise KeyError(key)
+        return keys
+
+    def dependents(self, key: Union[str, tuple, list]) -> set:
+        """ get all options which refer to key ('section.subsection.option'),
+        directly or transitively """
+        index = self._get_dependents_index()
+        start = self._split_full_key(key)
+        seen = set()
+        stack = [start]
+        while stack:
+            for dependent in index.get(stack.pop(), ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    stack.append(dependent)
+        seen.discard(start)
+        return {'.'.join(k) for k in seen}
+
+    def invalidate(self, key: Union[str, tuple, list]) -> set:
+        """ drop cached interpolated values of key and its dependents,
+        return full keys which were invalidated """
+        resolved = self.resolved_cache
+        full_key = self._split_full_key(key)
+        invalidated = self.dependents(full_key)
+        invalidated.add('.'.join(full_key))
+        for k in invalidated:
+            resolved.pop(tuple(k.split('.')), None)
+        return invalidated
+
+    def with_overrides(self, overrides: List[str]) -> 'DictConfig':
+        """ return new config with overrides ('section.subsection.option=value') applied
+
+        options of untouched subsections are not copied, their contents are frozen and
+        shared between both configs until one of them modifies it (copy on write), cached
+        interpolated values are kept except the ones which depend on overridden options
+        """
+        root = self.get_root()
+        changes = ZyConfig.parse_overrides(overrides, root)
+        by_node = {}
+        for (section, subsection, option), value in changes.items():
+            by_node.setdefault(section, {}).setdefault(subsection, {})[option] = value
+
+        new_root = root._clone(None, {})
+        for section, section_config in root._content.items():
+            if not isinstance(section_config, DictConfig):
+                new_root._content[section] = section_config
+                continue
+            sub_changes = by_node.get(section, {})
+            new_section = section_config._clone(new_root, {})
+            new_root._content[section] = new_section
+            for subsection, subsect_config in section_config._content.items():
+                if not isinstance(subsect_config, DictConfig):
+                    new_section._content[subsection] = subsect_config
+                    continue
+                content = subsect_config._freeze()
+                if subsection in sub_changes:
+                    content = dict(content)
+                    content.update(sub_changes[subsection])
+                new_section._content[subsection] = subsect_config._clone(new_section, content)
+        # sections and subsections which only exist in overrides
+        for section, sub_changes in by_node.items():
+            new_section = new_root._content.get(section)
+            if new_section is None:
+                new_section = DictConfig._new_child(new_root, section, ConfigLevel.SUBSECTION, {})
+            for subsection, options in sub_changes.items():
+                if subsection not in new_section._content:
+                    DictConfig._new_child(new_section, subsection, ConfigLevel.OPTION, dict(options))
+
+        # only values which depend on overridden options have to be re-resolved
+        if root._resolved is not _UNSET:
+            invalidated = set(changes)
+            for key in changes:
+                invalidated.update(tuple(k.split('.')) for k in root.dependents(key))
+            new_root.__dict__['_resolved'] = {k: v for k, v in root._resolved.items()
+                                              if k not in invalidated}
+        if root._paths is not _UNSET and all(key in root._paths[1].get(key[2], ()) for key in changes):
+            new_root.__dict__['_paths'] = root._paths
+        else:
+            new_root.build_index()
+        # options which are not overridden are still shared as they were loaded
+        new_root.__dict__['_dedup_stats'] = root._dedup_stats
+        return new_root
+
+    def _clone(self, parent: Optional['DictConfig'], content: Any) -> 'DictConfig':
+        """ shallow copy of node with new parent and content, caches of root are not copied """
+        node = type(self).__new__(type(self))
+        node.__dict__.update(self.__dict__, _parent=parent, _content=content, _resolved=_UNSET,
+                             _dependents=_UNSET, _paths=_UNSET, _dedup_stats=_UNSET)
+        return node
+
+    def _freeze(self) -> MappingProxyType:
+        """ make content read only, so it can be shared between configs """
+        if not isinstance(self._content, MappingProxyType):
+            self.__dict__['_content'] = MappingProxyType(self._content)
+        return self._content
+
+    def _own_content(self) -> dict:
+        """ content to be modified, shared (frozen) content is copied first (copy on write) """
+        if isinstance(self._content, MappingProxyType):
+            self.__dict__['_content'] = dict(self._content)
+        return self._content
+
+    @staticmethod
+    def _new_child(parent: 'DictConfig', name: str, config_level: ConfigLevel, content: dict) -> 'DictConfig':
+        node = DictConfig(None, config_level, parent)
+        node._set_name(name)
+        node.__dict__['_content'] = content
+        parent._content[node._name] = node
+        return node
+
+    def build_index(self):
+        """ build index of option paths of the whole tree, used by select() """
+        root = self.get_root()
+        paths = []
+        options = {}
+        for section, section_config in root._content.items():
+            if not isinstance(section_config, DictConfig):
+                continue
+            for subsection, subsect_config in section_config._content.items():
+                if not isinstance(subsect_config, DictConfig):
+                    continue
+                for option in subsect_config._content:
+                    path = (section, subsection, option)
+                    paths.append(path)
+                    options.setdefault(option, []).append(path)
+        root.__dict__['_paths'] = (paths, options)
+
+    def select(self, pattern: str) -> Iterator[Tuple[str, Any]]:
+        """ lazily iterate (path, value) pairs under this node which match pattern,
+        ex: 'server@*.port', '*.*.host', 'log4z_subsys.*'
+
+        pattern has form section[@subsection[.option]] or section[.subsection[.option]],
+        each part may contain shell-style wildcards (*, ?, [seq]).
+        Pattern is always matched against full paths from root, paths outside of this node are skipped,
+        ex: conf.server.select('*.*.port') only yields ports of section 'server'.
+        Only yielded values are resolved
+        """
+        parts = [self.normalize_key(p) for p in self._KEY_SPLITRE.split(pattern, 2)]
+        root = self.get_root()
+        # full path of this node, () for root
+        prefix = tuple(self.get_full_key(''))[:-1]
+        if len(parts) == 3:
+            if root._paths is _UNSET:
+                root.build_index()
+            paths, options = root._paths
+            section, subsection, option = parts
+            candidates = paths if self._has_wildcard(option) else options.get(option, ())
+            for path in candidates:
+                if path[:len(prefix)] == prefix and fnmatchcase(path[0], section) and \
+                        fnmatchcase(path[1], subsection) and fnmatchcase(path[2], option):
+                    yield '.'.join(path), root.get_raw(path[0]).get_raw(path[1])._get(path[2])
+            return
+
+        node_paths = [((), root)]
+        for depth, part in enumerate(parts):
+            matched = []
+            for keys, node in node_paths:
+                if not isinstance(node, DictConfig):
+                    continue
+                for k in node._content:
+                    if depth < len(prefix) and k != prefix[depth]:
+                        continue
+                    if fnmatchcase(k, part):
+                        matched.append((keys + (k,), node._get(k)))
+            node_paths = matched
+        for keys, node in node_paths:
+            yield '.'.join(keys), node
+
+    @staticmethod
+    def _has_wildcard(part: str) -> bool:
+        return any(c in part for c in '*?[')
+
+    @property
+    def dedup_stats(self) -> dict:
+        """ number of shared keys, values and bytes saved when config was loaded """
+        root = self.get_root()
+        if root._dedup_stats is _UNSET:
+            return {'deduplicated': 0, 'bytes_saved': 0}
+        return dict(root._dedup_stats)
+
+    def pretty(self, indent: int = 2) -> str:
+        """ print the representation of DictConfig, nested keys are indented,
+        values are raw (not interpolated), ex:
+        db:
+          main:
+            url = ${db.main.host}:${db.main.port}
+        """
+        lines = []
+        stack = [(iter(self._content.items()), 0)]
+        while stack:
+            items, depth = stack[-1]
+            item = next(items, None)
+            if item is None:
+                stack.pop()
+                continue
+            key, value = item
+            if isinstance(value, DictConfig):
+                lines.append(f'{" " * depth}{key}:')
+                stack.append((iter(value._content.items()), depth + indent))
+            else:
+                lines.append(f'{" " * depth}{key} = {self._format_ini_value(value)}')
+        return '\n'.join(lines) + '\n' if lines else ''
+
+    def _iter_subsections(self) -> Iterator[Tuple[str, str, 'DictConfig']]:
+        """ iterate (section, subsection, node) of subsections under this node """
+        if self.cfg_level_type == ConfigLevel.OPTION:
+            keys = self.get_full_key('')
+            yield keys[0], keys[1], self
+            return
+        if self.cfg_level_type == ConfigLevel.SUBSECTION:
+            sections = [(self.get_full_key('')[0], self)]
+        else:
+            sections = ((section, self.get_raw(section)) for section in self._content)
+        for section, section_config in sections:
+            if not isinstance(section_config, DictConfig):
+                raise ValueError(f'Option {section!r} without section can not be written to INI')
+            for subsection in section_config._content:
+                subsect_config = section_config.get_raw(subsection)
+                if not isinstance(subsect_config, DictConfig):
+                    raise ValueError(f'Option {section}.{subsection} without subsection can not be written to INI')
+                yield section, subsection, subsect_config
+
+    def dump_ini(self, fp: Any, resolve: bool = True):
+        """ write config as INI ([section@subsection] headers) to file object fp,
+        the output can be read again by ZyConfig.read """
+        first = True
+        for section, subsection, node in self._iter_subsections():
+            if not first:
+                fp.write('\n')
+            first = False
+            if subsection == ZyConfig.DEFAULT_SUBSECT:
+                fp.write(f'[{section}]\n')
+            else:
+                fp.write(f'[{section}@{subsection}]\n')
+            for option in node._content:
+                value = node._get(option) if resolve else node.get_raw(option)
+                fp.write(f'{option} = {self._format_ini_value(value)}\n')
+
+    def _format_ini_value(self, value: Any) -> str:
+        """ format value which is inferred back to itself when reading """
+        if not isinstance(value, str):
+            return repr(value)
+        text = value
+        if text != text.strip() or '\n' in text or not isinstance(self._INTERPOLATION.infer_type(text), str):
+            text = repr(text)
+        return text
+
+    def dump_json(self, fp: Any, resolve: bool = True):
+        """ write config as JSON to file object fp, node by node """
+        import json
+        fp.write('{')
+        for i, key in enumerate(self._content):
+            if i:
+                fp.write(', ')
+            fp.write(json.dumps(key))
+            fp.write(': ')
+            value = self._get(key) if resolve else self.get_raw(key)
+            if isinstance(value, DictConfig):
+                value.dump_json(fp, resolve)
+            else:
+                fp.write(json.dumps(value, default=str))
+        fp.write('}')
 
     @staticmethod
     def is_primitive(value: Any) -> bool:
@@ -509,6 +951,9 @@ class DictConfig(MutableMapping):
         assert isinstance(parent, DictConfig) or parent is None
         self.__dict__['_parent'] = parent
 
+    def _set_name(self, name):
+        self.__dict__['_name'] = sys.intern(self.normalize_key(name))
+
     @property
     def parent(self):
         return self._parent
@@ -533,7 +978,7 @@ class ZyConfig(object):
     # Regular expression để split section@subsection header
     _SECT_SPLIT_TMPL = r"\@+"
     # Compiled regular expression for split section, subsect headers
-    _SECTSPLITRE = re.compile(_SECT_SPLIT_TMPL)
+    _SECTSPLITRE = _LazyAttribute(lambda: re.compile(ZyConfig._SECT_SPLIT_TMPL))
 
     @staticmethod
     def _from_configparser(config):
@@ -541,16 +986,24 @@ class ZyConfig(object):
         """ contruct config tree from config parser """
         if not isinstance(config, RawConfigParser):
             return None
+        return ZyConfig.from_dict(ZyConfig._group_sections(config), 'ROOT', 0)
 
+    @staticmethod
+    def _group_sections(config: RawConfigParser) -> dict:
+        """ validate [section@subsection] headers of config parser,
+        return {section : {subsection : options}} (names are normalized) """
         config_data = {}
         for key in config._sections:
             if key:
                 # split section@subsection
                 headers = ZyConfig._SECTSPLITRE.split(key)
-                headers = [s for s in headers if s]
+                if not headers[0]:
+                    # header is [@subsection] or [@]
+                    raise InvalidSectionError(key)
+                headers = [s.lower() for s in headers if s]
                 if len(headers) >= ZyConfig.MAX_CONFIG_LEVEL:
                     # header contains more than one subsection
-                    raise MaxConfigLevelError(headers, ZyConfig.MAX_CONFIG_LEVEL)
+                    raise MaxConfigLevelError(len(headers), ZyConfig.MAX_CONFIG_LEVEL, key)
 
                 section = headers[0]
                 try:
@@ -570,14 +1023,16 @@ class ZyConfig(object):
                     raise DuplicateSectionError(section)
                 d[subsection] = config._sections[key]
                 config_data[section] = d
-
-        return ZyConfig.from_dict(config_data, 'ROOT', 0)
+        return config_data
 
     @staticmethod
-    def from_dict(dict_config, header, depth, parent=None):
-        """ recursively construct linked config node from python dict """
+    def from_dict(dict_config, header, depth, parent=None, value_pool=None):
+        """ recursively construct linked config node from python dict,
+        identical keys and values of the whole tree are shared by value_pool """
         if depth >= ZyConfig.MAX_CONFIG_LEVEL:
             raise MaxConfigLevelError(header, ZyConfig.MAX_CONFIG_LEVEL, header)
+        if value_pool is None:
+            value_pool = ValuePool()
 
         current_dict_config = None
         # store {section : dict_config}
@@ -585,7 +1040,7 @@ class ZyConfig(object):
         for key, d in dict_config.items():
             if isinstance(d, dict):
                 # lazy init parent
-                options_to_values[key] = ZyConfig.from_dict(d, key, depth + 1)
+                options_to_values[key] = ZyConfig.from_dict(d, key, depth + 1, value_pool=value_pool)
             else:
                 options_to_values[key] = d
 
@@ -596,9 +1051,9 @@ class ZyConfig(object):
             raise MaxConfigLevelError(depth, ZyConfig.MAX_CONFIG_LEVEL, header)
         # if current dict is first node
         if depth == 0:
-            current_dict_config = DictConfig(options_to_values, config_level, parent)
+            current_dict_config = DictConfig(options_to_values, config_level, parent, value_pool)
         else:
-            current_dict_config = DictConfig(options_to_values, config_level)
+            current_dict_config = DictConfig(options_to_values, config_level, value_pool=value_pool)
 
         # set parent for child DictConfig
         for k, value in options_to_values.items():
@@ -607,11 +1062,77 @@ class ZyConfig(object):
                     value.parent = current_dict_config
                 except ReadOnlyConfigError:
                     raise
+                value._set_name(k)
+        if depth == 0:
+            current_dict_config.build_index()
+            current_dict_config.__dict__['_dedup_stats'] = value_pool.stats()
         return current_dict_config
 
     @staticmethod
-    def read(filenames: Union[str, os.PathLike]) -> DictConfig:
-        """ read config from file"""
+    def parse_overrides(overrides: List[str], config: DictConfig) -> dict:
+        """ parse and type-check a batch of overrides ('section@subsection.option=value'
+        or 'section.subsection.option=value') against config,
+        return {(section, subsection, option) : value} """
+        if isinstance(overrides, str):
+            overrides = [overrides]
+        changes = {}
+        for override in overrides:
+            try:
+                key, value = ZyConfig._parse_override(override, config)
+            except OverrideError:
+                raise
+            except Exception as err:
+                raise OverrideError(override, f'{type(err).__name__}: {err}') from err
+            changes[key] = value
+        return changes
+
+    @staticmethod
+    def _parse_override(override: str, config: DictConfig) -> Tuple[tuple, Any]:
+        """ parse and type-check one override, return ((section, subsection, option), value) """
+        key, sep, raw_value = override.partition('=')
+        if not sep:
+            raise OverrideError(override, "expected form 'section.subsection.option=value'")
+        keys = [config.normalize_key(k.strip()) for k in DictConfig._KEY_SPLITRE.split(key.strip())]
+        if len(keys) != ZyConfig.MAX_CONFIG_LEVEL or not all(keys):
+            raise OverrideError(override, "expected form 'section.subsection.option=value'")
+
+        node = config
+        for k in keys:
+            if not isinstance(node, DictConfig):
+                raise OverrideError(override, f'{node!r} is not a section or subsection')
+            node = node._content.get(k, _UNSET)
+            if node is _UNSET:
+                break
+        if isinstance(node, DictConfig):
+            raise OverrideError(override, 'can not override a section or subsection')
+
+        raw_value = raw_value.strip()
+        try:
+            DictConfig._INTERPOLATION.check_syntax(raw_value)
+        except ValueError as err:
+            raise OverrideError(override, str(err))
+        value = DictConfig._INTERPOLATION.infer_type(raw_value)
+        # type of a reference is only known after it is resolved
+        is_reference = isinstance(value, str) and '${' in value
+        if node is not _UNSET and not is_reference and not ZyConfig._is_compatible_type(node, value):
+            raise OverrideError(override, f'expected {type(node).__name__}, got {value!r}')
+        return tuple(keys), value
+
+    @staticmethod
+    def _is_compatible_type(old_value: Any, new_value: Any) -> bool:
+        """ string or None values can be overridden by any value,
+        numbers and booleans only by the same type (int is accepted for float) """
+        if old_value is None or isinstance(old_value, str):
+            return True
+        if isinstance(old_value, bool) or isinstance(new_value, bool):
+            return type(old_value) == type(new_value)
+        if isinstance(old_value, float):
+            return isinstance(new_value, (int, float))
+        return isinstance(new_value, type(old_value))
+
+    @staticmethod
+    def read(filenames: Union[str, os.PathLike], overrides: Optional[List[str]] = None) -> DictConfig:
+        """ read config from file, then apply overrides ('section.subsection.option=value') """
         config = RawConfigParser()
         try:
             config.read(filenames)
@@ -619,4 +1140,43 @@ class ZyConfig(object):
             raise
         zcfg = ZyConfig._from_configparser(config)
         del config
+        if overrides:
+            zcfg = zcfg.with_overrides(overrides)
         return zcfg
+
+    @staticmethod
+    def read_value(filenames: Union[str, os.PathLike], key: str, default: Optional[Any] = _UNSET) -> Any:
+        """ read single value ('section.subsection.option') without building config tree,
+        fall back to ZyConfig.read when value refers to other values
+
+        headers are validated as in ZyConfig.read, other options are not inferred
+        nor interpolated, so their errors are not raised """
+        keys = [k.lower() for k in DictConfig._KEY_SPLITRE.split(key)]
+        if len(keys) != ZyConfig.MAX_CONFIG_LEVEL:
+            raise KeyError(key)
+        section, subsection, option = keys
+        config = RawConfigParser()
+        config.read(filenames)
+        config_data = ZyConfig._group_sections(config)
+        del config
+
+        try:
+            if section not in config_data:
+                raise NoSectionError(section)
+            if subsection not in config_data[section]:
+                raise NoSubsectionError(subsection)
+            if option not in config_data[section][subsection]:
+                raise NoOptionError(section, subsection, option)
+        except (NoSectionError, NoSubsectionError, NoOptionError):
+            if default is not _UNSET:
+                return default
+            raise
+        raw_value = config_data[section][subsection][option]
+
+        # same as inferring when value is set, then when value is get
+        value = DictConfig._INTERPOLATION.infer_type(raw_value)
+        if isinstance(value, str):
+            if '$' in value:
+                return ZyConfig.read(filenames)[section][subsection][option]
+            value = DictConfig._INTERPOLATION.infer_type(value)
+        return value